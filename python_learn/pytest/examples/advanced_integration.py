@@ -145,18 +145,25 @@ class TestUserServiceIntegration:
 class AsyncAPIClient:
     """Example async API client"""
 
-    def __init__(self, session):
+    def __init__(self, session, max_concurrency: int = 32):
+        # For real HTTP, pair this with aiohttp.TCPConnector(limit=max_concurrency)
+        # on the session so the socket pool is capped to the same bound
         self.session = session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def fetch_user(self, user_id: int) -> Dict[str, Any]:
         """Fetch user data asynchronously"""
         async with self.session.get(f"/users/{user_id}") as response:
             return await response.json()
 
+    async def _bounded_fetch_user(self, user_id: int) -> Dict[str, Any]:
+        """Fetch a user while holding a concurrency slot"""
+        async with self._semaphore:
+            return await self.fetch_user(user_id)
+
     async def bulk_fetch_users(self, user_ids: List[int]) -> List[Dict[str, Any]]:
-        """Fetch multiple users concurrently"""
-        tasks = [self.fetch_user(user_id) for user_id in user_ids]
-        return await asyncio.gather(*tasks)
+        """Fetch multiple users concurrently, bounded by max_concurrency"""
+        return await asyncio.gather(*map(self._bounded_fetch_user, user_ids))
 
 
 @pytest.fixture
@@ -203,6 +210,27 @@ class TestAsyncOperations:
         for result in results:
             assert result == {"id": 1, "name": "Test User"}
 
+    @pytest.mark.asyncio
+    async def test_bulk_fetch_respects_max_concurrency(self):
+        """Test that bulk fetches never exceed max_concurrency in flight"""
+        client = AsyncAPIClient(session=None, max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch_user(user_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": user_id}
+
+        client.fetch_user = fake_fetch_user
+        results = await client.bulk_fetch_users(list(range(10)))
+
+        assert results == [{"id": user_id} for user_id in range(10)]
+        assert peak == 3
+
 
 # =============================================================================
 # 3. Database Integration Testing with Real Database
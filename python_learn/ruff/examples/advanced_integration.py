@@ -7,12 +7,124 @@ including custom configurations, CI/CD integration, and advanced rule management
 """
 
 import asyncio
+import copy
+import difflib
 import json
+import re
 import subprocess
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # In-process bindings to Ruff's formatter: https://pypi.org/project/ruff-api/
+    import ruff_api
+except ImportError:
+    ruff_api = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+# Static base configuration; generate_base_config hands out deep copies
+# because the customize_* methods mutate the nested lists and dicts
+_BASE_CONFIG: Dict[str, Any] = {
+    "tool": {
+        "ruff": {
+            "line-length": 88,
+            "target-version": "py311",
+            "select": [
+                "E",  # pycodestyle errors
+                "W",  # pycodestyle warnings
+                "F",  # Pyflakes
+                "I",  # isort
+                "B",  # flake8-bugbear
+                "C4",  # flake8-comprehensions
+                "UP",  # pyupgrade
+                "N",  # pep8-naming
+                "S",  # bandit
+                "A",  # flake8-builtins
+                "PERF",  # Perflint
+            ],
+            "ignore": [
+                "E501",  # line too long (handled by formatter)
+                "S101",  # assert detected (OK in tests)
+                "S311",  # random module (OK for non-crypto use)
+            ],
+            "exclude": [
+                ".git",
+                "__pycache__",
+                "venv",
+                ".venv",
+                "build",
+                "dist",
+                "migrations",
+                "node_modules",
+            ],
+            "per-file-ignores": {
+                "__init__.py": ["F401"],  # Unused imports OK
+                "tests/*": [
+                    "S101",
+                    "S106",
+                ],  # Assert and hardcoded passwords OK
+                "scripts/*": ["T201"],  # Print statements OK
+                "conftest.py": ["F401", "F403"],  # Star imports OK
+            },
+        },
+        "ruff.format": {
+            "quote-style": "double",
+            "indent-style": "space",
+            "skip-magic-trailing-comma": False,
+            "line-ending": "auto",
+        },
+        "ruff.isort": {
+            "known-first-party": ["myproject"],
+            "force-single-line": False,
+            "lines-after-imports": 2,
+        },
+    }
+}
+
+# Files Ruff reads settings from, in its order of precedence within a directory
+_RUFF_CONFIG_FILES = (".ruff.toml", "ruff.toml", "pyproject.toml")
+
+# Top-level settings that ruff-api's FormatOptions can express
+_FORMAT_OPTION_KEYS = {
+    "line-length": "line_width",
+    "target-version": "target_version",
+    "preview": "preview",
+}
+
+# Settings that change formatter output but have no FormatOptions equivalent;
+# when one is present the format check goes through the CLI instead
+_UNSUPPORTED_FORMAT_KEYS = frozenset({"extend", "format", "indent-width"})
+
+# Line limit for reading json-lines output; asyncio's 64 KiB default is too
+# small for an issue carrying a large fix or source snippet
+_JSON_LINE_LIMIT = 16 * 1024 * 1024
+
+# Ruff rule codes: an upper-case linter prefix followed by digits (E701, UP006,
+# ASYNC110)
+_RULE_CODE_RE = re.compile(r"\b[A-Z]{1,5}\d{3,4}\b")
+
+
+def find_rule_codes(text: str) -> List[str]:
+    """Return the Ruff rule codes mentioned in text, e.g. a noqa comment."""
+    return _RULE_CODE_RE.findall(text)
+
 
 class RuffConfigManager:
     """
@@ -29,61 +141,7 @@ class RuffConfigManager:
 
     def generate_base_config(self) -> Dict[str, Any]:
         """Generate a base Ruff configuration for most projects."""
-        return {
-            "tool": {
-                "ruff": {
-                    "line-length": 88,
-                    "target-version": "py311",
-                    "select": [
-                        "E",  # pycodestyle errors
-                        "W",  # pycodestyle warnings
-                        "F",  # Pyflakes
-                        "I",  # isort
-                        "B",  # flake8-bugbear
-                        "C4",  # flake8-comprehensions
-                        "UP",  # pyupgrade
-                        "N",  # pep8-naming
-                        "S",  # bandit
-                        "A",  # flake8-builtins
-                    ],
-                    "ignore": [
-                        "E501",  # line too long (handled by formatter)
-                        "S101",  # assert detected (OK in tests)
-                        "S311",  # random module (OK for non-crypto use)
-                    ],
-                    "exclude": [
-                        ".git",
-                        "__pycache__",
-                        "venv",
-                        ".venv",
-                        "build",
-                        "dist",
-                        "migrations",
-                        "node_modules",
-                    ],
-                    "per-file-ignores": {
-                        "__init__.py": ["F401"],  # Unused imports OK
-                        "tests/*": [
-                            "S101",
-                            "S106",
-                        ],  # Assert and hardcoded passwords OK
-                        "scripts/*": ["T201"],  # Print statements OK
-                        "conftest.py": ["F401", "F403"],  # Star imports OK
-                    },
-                },
-                "ruff.format": {
-                    "quote-style": "double",
-                    "indent-style": "space",
-                    "skip-magic-trailing-comma": False,
-                    "line-ending": "auto",
-                },
-                "ruff.isort": {
-                    "known-first-party": ["myproject"],
-                    "force-single-line": False,
-                    "lines-after-imports": 2,
-                },
-            }
-        }
+        return copy.deepcopy(_BASE_CONFIG)
 
     def customize_for_web_framework(self, framework: str) -> Dict[str, Any]:
         """Customize configuration for web framework projects."""
@@ -163,7 +221,9 @@ class RuffRunner:
         ignore: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Run Ruff check asynchronously and return structured results."""
-        cmd = ["ruff", "check", "--output-format=json"]
+        # json-lines emits one issue per line, so issues can be parsed as they
+        # arrive instead of buffering and decoding the whole report at once
+        cmd = ["ruff", "check", "--output-format=json-lines"]
 
         if fix:
             cmd.append("--fix")
@@ -182,52 +242,215 @@ class RuffRunner:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.project_root,
+                limit=_JSON_LINE_LIMIT,
             )
 
-            stdout, stderr = await process.communicate()
-
+            issues = []
+            raw_lines = []
+
+            async def collect_issues():
+                async for line in process.stdout:
+                    if not line.strip():
+                        continue
+                    try:
+                        issues.append(_json_loads(line))
+                    except json.JSONDecodeError:
+                        raw_lines.append(line.decode())
+
+            # Drain stderr alongside stdout so neither pipe can fill and block
+            _, stderr = await asyncio.gather(collect_issues(), process.stderr.read())
+            await process.wait()
+
+            # stdout keeps only the lines that were not issues, e.g. messages
+            # Ruff prints alongside the report
+            stdout = "".join(raw_lines)
             result = {
                 "returncode": process.returncode,
-                "stdout": stdout.decode(),
+                "stdout": stdout,
                 "stderr": stderr.decode(),
-                "issues": [],
+                "issues": issues,
             }
 
-            if stdout:
-                try:
-                    # Parse JSON output from Ruff
-                    issues = json.loads(stdout.decode())
-                    result["issues"] = issues
-                except json.JSONDecodeError:
-                    result["raw_output"] = stdout.decode()
+            if raw_lines:
+                result["raw_output"] = stdout
 
             return result
 
         except Exception as e:
             return {"returncode": 1, "error": str(e), "issues": []}
 
+    @staticmethod
+    def _format_check_command(paths: List[str]) -> List[str]:
+        """Build the ruff CLI command used when formatting is checked out of process."""
+        return ["ruff", "format", "--check", "--diff"] + paths
+
     def run_format_check(self, paths: List[str]) -> Dict[str, Any]:
         """Check if files need formatting without applying changes."""
-        cmd = ["ruff", "format", "--check", "--diff"] + paths
+        if ruff_api is not None and tomllib is not None:
+            result = self._run_format_check_in_process(paths)
+            if result is not None:
+                return result
+
+        cmd = self._format_check_command(paths)
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, cwd=self.project_root
-            )
+            # Capture bytes and decode only the output that carries information
+            result = subprocess.run(cmd, capture_output=True, cwd=self.project_root)
+            needs_formatting = result.returncode != 0
 
             return {
                 "returncode": result.returncode,
-                "needs_formatting": result.returncode != 0,
-                "diff": result.stdout,
-                "stderr": result.stderr,
+                "needs_formatting": needs_formatting,
+                "diff": result.stdout.decode() if needs_formatting else "",
+                "stderr": result.stderr.decode() if needs_formatting else "",
             }
 
         except subprocess.SubprocessError as e:
             return {"returncode": 1, "error": str(e), "needs_formatting": None}
 
-    def analyze_codebase(self, target_dir: str = ".") -> Dict[str, Any]:
-        """Perform comprehensive codebase analysis with Ruff."""
-        analysis = {
+    def _run_format_check_in_process(
+        self, paths: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check formatting through the ruff-api bindings without spawning ruff.
+
+        Returns None when the paths cannot be handled in-process (directories,
+        unreadable files, settings FormatOptions cannot express, or sources
+        ruff-api rejects) so the caller can fall back to the CLI.
+        """
+        diffs = []
+        options_by_dir: Dict[Path, Optional[Dict[str, Any]]] = {}
+
+        for path in paths:
+            file_path = self.project_root / path
+            if not file_path.is_file():
+                return None
+
+            directory = file_path.resolve().parent
+            if directory not in options_by_dir:
+                options_by_dir[directory] = self._format_options_for(directory)
+            options = options_by_dir[directory]
+            if options is None:
+                return None
+
+            try:
+                source = file_path.read_text()
+                formatted = ruff_api.format_string(
+                    str(file_path), source, ruff_api.FormatOptions(**options)
+                )
+            except (OSError, ruff_api.RuffError):
+                return None
+
+            if formatted != source:
+                diffs.extend(
+                    difflib.unified_diff(
+                        source.splitlines(keepends=True),
+                        formatted.splitlines(keepends=True),
+                        fromfile=path,
+                        tofile=path,
+                    )
+                )
+
+        returncode = 1 if diffs else 0
+        return {
+            "returncode": returncode,
+            "needs_formatting": returncode != 0,
+            "diff": "".join(diffs),
+            "stderr": "",
+        }
+
+    @staticmethod
+    def _format_options_for(directory: Path) -> Optional[Dict[str, Any]]:
+        """
+        Map the Ruff settings that apply to files in directory to FormatOptions
+        keyword arguments.
+
+        Like Ruff, the closest directory with a ruff.toml, .ruff.toml or a
+        pyproject.toml containing [tool.ruff] wins. Returns None when those
+        settings cannot be reproduced in-process.
+        """
+        for config_dir in (directory, *directory.parents):
+            try:
+                settings = RuffRunner._load_ruff_settings(config_dir)
+            except (OSError, tomllib.TOMLDecodeError):
+                return None
+            if settings is not None:
+                break
+        else:
+            return {}
+
+        if _UNSUPPORTED_FORMAT_KEYS.intersection(settings):
+            return None
+        # Without target-version Ruff infers it from requires-python, which
+        # FormatOptions cannot do
+        if "requires-python" in settings and "target-version" not in settings:
+            return None
+
+        return {
+            option: settings[key]
+            for key, option in _FORMAT_OPTION_KEYS.items()
+            if key in settings
+        }
+
+    @staticmethod
+    def _load_ruff_settings(directory: Path) -> Optional[Dict[str, Any]]:
+        """Return the Ruff settings defined in directory, or None if it has none."""
+        for name in _RUFF_CONFIG_FILES:
+            config_file = directory / name
+            if not config_file.is_file():
+                continue
+
+            with config_file.open("rb") as f:
+                data = tomllib.load(f)
+            if name != "pyproject.toml":
+                return data
+
+            # A pyproject.toml without [tool.ruff] does not stop Ruff's search
+            if "ruff" not in data.get("tool", {}):
+                continue
+            settings = dict(data["tool"]["ruff"])
+            requires_python = data.get("project", {}).get("requires-python")
+            if requires_python:
+                settings["requires-python"] = requires_python
+            return settings
+
+        return None
+
+    async def run_format_check_async(self, paths: List[str]) -> Dict[str, Any]:
+        """Check formatting asynchronously so it can overlap with linting."""
+        # The in-process check is cheaper than spawning ruff, so it runs
+        # inline; only the CLI fallback is awaited
+        if ruff_api is not None and tomllib is not None:
+            result = self._run_format_check_in_process(paths)
+            if result is not None:
+                return result
+
+        cmd = self._format_check_command(paths)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.project_root,
+            )
+
+            stdout, stderr = await process.communicate()
+
+            return {
+                "returncode": process.returncode,
+                "needs_formatting": process.returncode != 0,
+                "diff": stdout.decode(),
+                "stderr": stderr.decode(),
+            }
+
+        except Exception as e:
+            return {"returncode": 1, "error": str(e), "needs_formatting": None}
+
+    @staticmethod
+    def _empty_analysis() -> Dict[str, Any]:
+        """Create the result skeleton shared by the analysis methods."""
+        return {
             "total_files": 0,
             "issues_by_category": {},
             "most_common_issues": [],
@@ -235,53 +458,81 @@ class RuffRunner:
             "summary": {},
         }
 
+    @staticmethod
+    def _summarize_issues(analysis: Dict[str, Any], issues: List[Dict]) -> None:
+        """Fill in issue statistics for a list of Ruff issues."""
+        # Categorize issues in a single pass
+        issue_counts = Counter()
+        files_with_issues = set()
+        auto_fixable = 0
+
+        for issue in issues:
+            issue_counts[issue.get("code", "UNKNOWN")] += 1
+            files_with_issues.add(issue.get("filename", "unknown"))
+            if issue.get("fix"):
+                auto_fixable += 1
+
+        analysis["issues_by_category"] = dict(issue_counts)
+        analysis["files_with_issues"] = list(files_with_issues)
+        analysis["total_issues"] = len(issues)
+
+        # Most common issues
+        most_common = issue_counts.most_common(10)
+        analysis["most_common_issues"] = most_common
+
+        # Generate summary
+        analysis["summary"] = {
+            "total_issues": len(issues),
+            "files_affected": len(files_with_issues),
+            "most_common_rule": most_common[0][0] if most_common else None,
+            "auto_fixable": auto_fixable,
+        }
+
+    def analyze_codebase(self, target_dir: str = ".") -> Dict[str, Any]:
+        """Perform comprehensive codebase analysis with Ruff."""
+        analysis = self._empty_analysis()
+
         # Run check to get all issues
         cmd = ["ruff", "check", target_dir, "--output-format=json"]
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, cwd=self.project_root
-            )
+            # The JSON parser accepts bytes, so skip the text decode entirely
+            result = subprocess.run(cmd, capture_output=True, cwd=self.project_root)
 
             if result.stdout:
-                issues = json.loads(result.stdout)
+                self._summarize_issues(analysis, _json_loads(result.stdout))
 
-                # Categorize issues
-                issue_counts = {}
-                files_with_issues = set()
+        except (subprocess.SubprocessError, json.JSONDecodeError) as e:
+            analysis["error"] = str(e)
 
-                for issue in issues:
-                    rule_code = issue.get("code", "UNKNOWN")
-                    files_with_issues.add(issue.get("filename", "unknown"))
+        return analysis
 
-                    if rule_code not in issue_counts:
-                        issue_counts[rule_code] = 0
-                    issue_counts[rule_code] += 1
+    async def analyze_codebase_async(self, target_dirs: List[str]) -> Dict[str, Any]:
+        """Analyze several directories with one concurrent Ruff run per shard."""
+        analysis = self._empty_analysis()
 
-                analysis["issues_by_category"] = issue_counts
-                analysis["files_with_issues"] = list(files_with_issues)
-                analysis["total_issues"] = len(issues)
+        results = await asyncio.gather(
+            *(self.run_check_async([target_dir]) for target_dir in target_dirs)
+        )
 
-                # Most common issues
-                sorted_issues = sorted(
-                    issue_counts.items(), key=lambda x: x[1], reverse=True
-                )
-                analysis["most_common_issues"] = sorted_issues[:10]
-
-                # Generate summary
-                analysis["summary"] = {
-                    "total_issues": len(issues),
-                    "files_affected": len(files_with_issues),
-                    "most_common_rule": sorted_issues[0][0] if sorted_issues else None,
-                    "auto_fixable": sum(1 for issue in issues if issue.get("fix")),
-                }
+        issues = []
+        errors = []
+        for target_dir, result in zip(target_dirs, results):
+            issues.extend(result.get("issues", []))
+            if "error" in result:
+                errors.append(f"{target_dir}: {result['error']}")
 
-        except (subprocess.SubprocessError, json.JSONDecodeError) as e:
-            analysis["error"] = str(e)
+        self._summarize_issues(analysis, issues)
+        if errors:
+            analysis["error"] = "; ".join(errors)
 
         return analysis
 
 
+# Directories whose files are generated or vendored and never linted
+_GENERATED_PATH_RE = re.compile(r"(?:migrations|__pycache__|\.git|\.?venv|build|dist)/")
+
+
 class RuffPreCommitHook:
     """
     Custom pre-commit hook implementation using Ruff.
@@ -297,22 +548,10 @@ class RuffPreCommitHook:
 
     def should_check_file(self, file_path: Path) -> bool:
         """Determine if a file should be checked by Ruff."""
-        if not file_path.suffix == ".py":
-            return False
-
-        # Skip generated files
-        generated_patterns = [
-            "migrations/",
-            "__pycache__/",
-            ".git/",
-            "venv/",
-            ".venv/",
-            "build/",
-            "dist/",
-        ]
-
-        file_str = str(file_path)
-        return not any(pattern in file_str for pattern in generated_patterns)
+        # Skip non-Python and generated files
+        return file_path.suffix == ".py" and not _GENERATED_PATH_RE.search(
+            str(file_path)
+        )
 
     async def run_pre_commit_check(self, staged_files: List[Path]) -> Dict[str, Any]:
         """Run pre-commit checks on staged files."""
@@ -325,12 +564,14 @@ class RuffPreCommitHook:
                 "issues": [],
             }
 
-        # Check formatting first
-        format_result = self.runner.run_format_check(python_files)
-
-        # Then run linting
-        lint_result = await self.runner.run_check_async(
-            python_files, fix=False  # Don't auto-fix in pre-commit
+        # Run the format check and linting concurrently; for small staged
+        # sets Ruff start-up dominates, so overlapping them halves wall time
+        format_result, lint_result = await asyncio.gather(
+            self.runner.run_format_check_async(python_files),
+            self.runner.run_check_async(
+                python_files,
+                fix=False,  # Don't auto-fix in pre-commit
+            ),
         )
 
         success = format_result["returncode"] == 0 and lint_result["returncode"] == 0
@@ -454,6 +695,49 @@ async def demonstrate_advanced_usage():
     print(f"Analysis: {analysis.get('summary', {})}")
 
 
+def test_find_rule_codes_includes_five_letter_prefixes():
+    """Codes from linters such as flake8-async are not dropped."""
+    text = "x = 1  # noqa: E701, UP006, ASYNC110, PERF401"
+    assert find_rule_codes(text) == ["E701", "UP006", "ASYNC110", "PERF401"]
+
+
+def test_format_check_in_process_honours_line_length(tmp_path):
+    """A file that is only clean at a non-default line length passes."""
+    import pytest
+
+    if ruff_api is None or tomllib is None:
+        pytest.skip("needs ruff-api and a TOML parser")
+
+    (tmp_path / "pyproject.toml").write_text("[tool.ruff]\nline-length = 20\n")
+    # At the default 88 columns Ruff would join this call onto one line
+    (tmp_path / "narrow.py").write_text("result = call(\n    first, second\n)\n")
+
+    result = RuffRunner(tmp_path)._run_format_check_in_process(["narrow.py"])
+
+    assert result is not None
+    assert result["needs_formatting"] is False
+    cli = subprocess.run(["ruff", "format", "--check", "narrow.py"], cwd=tmp_path)
+    assert cli.returncode == 0
+
+
+def test_format_check_falls_back_for_unsupported_settings(tmp_path):
+    """Settings FormatOptions cannot express route the check through the CLI."""
+    import pytest
+
+    if ruff_api is None or tomllib is None:
+        pytest.skip("needs ruff-api and a TOML parser")
+
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.ruff.format]\nquote-style = "single"\n'
+    )
+    (tmp_path / "quotes.py").write_text("x = 'a'\n")
+
+    runner = RuffRunner(tmp_path)
+
+    assert runner._run_format_check_in_process(["quotes.py"]) is None
+    assert runner.run_format_check(["quotes.py"])["needs_formatting"] is False
+
+
 if __name__ == "__main__":
     # Run the demonstration
     asyncio.run(demonstrate_advanced_usage())
@@ -6,6 +6,8 @@ This file demonstrates basic usage patterns of Ruff for Python code quality.
 These examples show common scenarios and how Ruff helps improve code quality.
 """
 
+import tempfile
+
 # Example 1: Import Sorting and Organization
 # Ruff automatically sorts and organizes imports using isort rules
 
@@ -17,11 +19,14 @@ These examples show common scenarios and how Ruff helps improve code quality.
 # import asyncio
 
 # After Ruff formatting (with I001, I002 rules):
-import asyncio
-import os
-import sys
-from collections import defaultdict
-from typing import Dict, List
+# import asyncio
+# import os
+# import sys
+# from collections import defaultdict
+# from typing import Dict, List
+#
+# None of these modules are used below, so the block is shown as a comment
+# rather than imported (F401 would flag every line).
 
 
 # Example 2: Code Style Fixes
@@ -119,99 +124,98 @@ def quote_examples():
 # Ruff can modernize Python syntax automatically
 
 
-def modern_syntax_examples():
-    """Examples of syntax modernization."""
+# UP006: Use `list` instead of `List` for type annotations (Python 3.9+)
+# Before: def old_style_typing(items: List[str]) -> Dict[str, int]:
+# UP007: Use `X | Y` for union types (Python 3.10+)
+def _old_style_typing(items: list[str]) -> dict[str, int]:
+    # PERF403: build the mapping from C-level iterators, not a manual loop;
+    # map() looks up `len` once instead of once per item
+    return dict(zip(items, map(len, items)))
+
 
-    # UP006: Use `list` instead of `List` for type annotations (Python 3.9+)
-    def old_style_typing(items: List[str]) -> Dict[str, int]:
-        # UP007: Use `X | Y` for union types (Python 3.10+)
-        result: Dict[str, int] = {}
-        for item in items:
-            result[item] = len(item)
-        return result
+# Modern equivalent (after Ruff UP rules):
+def _modern_style_typing(items: list[str]) -> dict[str, int]:
+    return dict(zip(items, map(len, items)))
 
-    # Modern equivalent (after Ruff UP rules):
-    def modern_style_typing(items: list[str]) -> dict[str, int]:
-        result: dict[str, int] = {}
-        for item in items:
-            result[item] = len(item)
-        return result
 
-    return old_style_typing, modern_style_typing
+def modern_syntax_examples():
+    """Examples of syntax modernization."""
+    return _old_style_typing, _modern_style_typing
 
 
 # Example 7: Security Issues Detection
 # Ruff includes bandit security rules (S prefix)
 
 
-def security_examples():
-    """Examples of security issue detection."""
+# S101: Use of assert detected (not recommended in production)
+def _function_with_assert(value):
+    assert value > 0, "Value must be positive"
+    return value * 2
+
 
-    # S101: Use of assert detected (not recommended in production)
-    def function_with_assert(value):
-        assert value > 0, "Value must be positive"
-        return value * 2
+# S102: Use of exec detected (security risk)
+def _dangerous_exec_usage():
+    # This would be flagged by Ruff
+    # exec("print('Hello World')")
+    pass
 
-    # S102: Use of exec detected (security risk)
-    def dangerous_exec_usage():
-        # This would be flagged by Ruff
-        # exec("print('Hello World')")
-        pass
 
-    # S108: Probable insecure usage of temp file/directory
-    def temp_file_usage():
-        import tempfile
+# S108: Probable insecure usage of temp file/directory
+def _temp_file_usage():
+    # Better: use tempfile.mkstemp() or tempfile.NamedTemporaryFile()
+    temp_dir = tempfile.mkdtemp()
+    return temp_dir
 
-        # Better: use tempfile.mkstemp() or tempfile.NamedTemporaryFile()
-        temp_dir = tempfile.mkdtemp()
-        return temp_dir
 
-    return function_with_assert, dangerous_exec_usage, temp_file_usage
+def security_examples():
+    """Examples of security issue detection."""
+    return _function_with_assert, _dangerous_exec_usage, _temp_file_usage
 
 
 # Example 8: Complexity and Readability
 # Ruff can detect overly complex code patterns
 
 
-def complexity_examples():
-    """Examples of complexity detection and improvement."""
-
-    # C901: Function is too complex (McCabe complexity)
-    def complex_function(a, b, c, d, e):
-        """This function has high cyclomatic complexity."""
-        if a > 0:
-            if b > 0:
-                if c > 0:
-                    if d > 0:
-                        if e > 0:
-                            return a + b + c + d + e
-                        else:
-                            return a + b + c + d
+# C901: Function is too complex (McCabe complexity)
+def _complex_function(a, b, c, d, e):
+    """This function has high cyclomatic complexity."""
+    if a > 0:
+        if b > 0:
+            if c > 0:
+                if d > 0:
+                    if e > 0:
+                        return a + b + c + d + e
                     else:
-                        return a + b + c
+                        return a + b + c + d
                 else:
-                    return a + b
+                    return a + b + c
             else:
-                return a
+                return a + b
         else:
-            return 0
-
-    # Better approach with early returns
-    def simplified_function(a, b, c, d, e):
-        """Simplified version with lower complexity."""
-        if a <= 0:
-            return 0
-        if b <= 0:
             return a
-        if c <= 0:
-            return a + b
-        if d <= 0:
-            return a + b + c
-        if e <= 0:
-            return a + b + c + d
-        return a + b + c + d + e
-
-    return complex_function, simplified_function
+    else:
+        return 0
+
+
+# Better approach with early returns
+def _simplified_function(a, b, c, d, e):
+    """Simplified version with lower complexity."""
+    if a <= 0:
+        return 0
+    if b <= 0:
+        return a
+    if c <= 0:
+        return a + b
+    if d <= 0:
+        return a + b + c
+    if e <= 0:
+        return a + b + c + d
+    return a + b + c + d + e
+
+
+def complexity_examples():
+    """Examples of complexity detection and improvement."""
+    return _complex_function, _simplified_function
 
 
 # Example 9: Docstring Improvements
@@ -11,12 +11,29 @@ Target Audience: Mid-level Python developers
 Focus: Project scaffolding and standardized workflows
 """
 
+import functools
+import hashlib
+import os
+import string
 import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import AbstractSet, Dict, Final, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Generated files are small, so writing them is dominated by open/close waits
+FILE_WRITE_WORKERS = 8
+
+# Written into a finished project; holds the template digest and project name.
+# It lives inside .git so it never shows up as an untracked file
+TEMPLATE_MARKER = Path(".git") / "uvtemplate"
+
+# Upper bound on uv sync processes run at once by flush_syncs()
+MAX_SYNC_WORKERS = 8
+
 
 class ProjectType(Enum):
     """Supported project types for template generation."""
@@ -40,514 +57,109 @@ class ProjectTemplate:
     directory_structure: List[str]
     config_files: Dict[str, str]
     python_version: str = ">=3.9"
-
-
-class UVProjectTemplateManager:
-    """
-    Advanced project template manager using UV.
-
-    Provides standardized project initialization patterns for different
-    types of Python projects with best practices and modern tooling.
-    """
-
-    def __init__(self, base_directory: str = "."):
-        self.base_dir = Path(base_directory)
-        self.templates = self._initialize_templates()
-
-    def _initialize_templates(self) -> Dict[ProjectType, ProjectTemplate]:
-        """Initialize predefined project templates."""
-        return {
-            ProjectType.MICROSERVICE: ProjectTemplate(
-                name="microservice",
-                description="FastAPI-based microservice with monitoring and testing",
-                dependencies=[
-                    "fastapi>=0.104.0",
-                    "uvicorn[standard]>=0.24.0",
-                    "pydantic>=2.5.0",
-                    "pydantic-settings>=2.1.0",
-                    "httpx>=0.25.0",
-                    "structlog>=23.2.0",
-                    "prometheus-client>=0.19.0",
-                ],
-                dev_dependencies=[
-                    "pytest>=7.4.0",
-                    "pytest-asyncio>=0.21.0",
-                    "pytest-cov>=4.1.0",
-                    "httpx>=0.25.0",
-                    "ruff>=0.1.0",
-                    "mypy>=1.7.0",
-                    "pre-commit>=3.5.0",
-                ],
-                directory_structure=[
-                    "src/{project_name}",
-                    "src/{project_name}/api",
-                    "src/{project_name}/core",
-                    "src/{project_name}/models",
-                    "tests",
-                    "tests/unit",
-                    "tests/integration",
-                    "docker",
-                    "docs",
-                    "scripts",
-                ],
-                config_files={
-                    "main.py": self._get_microservice_main(),
-                    "Dockerfile": self._get_microservice_dockerfile(),
-                    "docker-compose.yml": self._get_microservice_docker_compose(),
-                    ".pre-commit-config.yaml": self._get_precommit_config(),
-                },
-            ),
-            ProjectType.DATA_SCIENCE: ProjectTemplate(
-                name="data_science",
-                description="Data science project with Jupyter, pandas, and MLOps tools",
-                dependencies=[
-                    "pandas>=2.1.0",
-                    "numpy>=1.25.0",
-                    "matplotlib>=3.8.0",
-                    "seaborn>=0.13.0",
-                    "scikit-learn>=1.3.0",
-                    "jupyter>=1.0.0",
-                    "plotly>=5.17.0",
-                    "mlflow>=2.8.0",
-                ],
-                dev_dependencies=[
-                    "pytest>=7.4.0",
-                    "black>=23.0.0",
-                    "isort>=5.12.0",
-                    "flake8>=6.1.0",
-                    "mypy>=1.7.0",
-                    "nbqa>=1.7.0",
-                ],
-                directory_structure=[
-                    "data/raw",
-                    "data/processed",
-                    "data/external",
-                    "notebooks",
-                    "src/{project_name}",
-                    "src/{project_name}/data",
-                    "src/{project_name}/features",
-                    "src/{project_name}/models",
-                    "src/{project_name}/visualization",
-                    "tests",
-                    "reports/figures",
-                    "models",
-                ],
-                config_files={
-                    "jupyter_config.py": self._get_jupyter_config(),
-                    "cookiecutter.json": self._get_data_science_cookiecutter(),
-                    ".gitignore": self._get_data_science_gitignore(),
-                },
-            ),
-            ProjectType.CLI_TOOL: ProjectTemplate(
-                name="cli_tool",
-                description="Command-line interface tool with Click and rich output",
-                dependencies=[
-                    "click>=8.1.0",
-                    "rich>=13.7.0",
-                    "typer>=0.9.0",
-                    "pydantic>=2.5.0",
-                    "toml>=0.10.0",
-                ],
-                dev_dependencies=[
-                    "pytest>=7.4.0",
-                    "pytest-click>=1.1.0",
-                    "black>=23.0.0",
-                    "ruff>=0.1.0",
-                    "mypy>=1.7.0",
-                ],
-                directory_structure=[
-                    "src/{project_name}",
-                    "src/{project_name}/commands",
-                    "src/{project_name}/config",
-                    "src/{project_name}/utils",
-                    "tests",
-                    "docs",
-                ],
-                config_files={
-                    "cli.py": self._get_cli_main(),
-                    "config.py": self._get_cli_config(),
-                },
+    # pyproject.toml array bodies, formatted once since they never change
+    dependencies_block: str = field(init=False, repr=False)
+    dev_dependencies_block: str = field(init=False, repr=False)
+    # Every generated file with the template's own fields filled in, encoded
+    # once and split around {project_name}; rendering a project is then a
+    # single bytes.join per file
+    file_segments: Dict[str, List[bytes]] = field(init=False, repr=False)
+    # Short hash of everything the template generates
+    digest: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.dependencies_block = self._format_dependencies(self.dependencies)
+        self.dev_dependencies_block = self._format_dependencies(self.dev_dependencies)
+        files = {
+            "pyproject.toml": _PYPROJECT_TEMPLATE.substitute(
+                project_name="{project_name}",
+                description=self.description,
+                python_version=self.python_version,
+                dependencies=self.dependencies_block,
+                dev_dependencies=self.dev_dependencies_block,
             ),
-            ProjectType.LIBRARY: ProjectTemplate(
-                name="library",
-                description="Python library with comprehensive testing and documentation",
-                dependencies=[],  # Minimal dependencies for libraries
-                dev_dependencies=[
-                    "pytest>=7.4.0",
-                    "pytest-cov>=4.1.0",
-                    "black>=23.0.0",
-                    "ruff>=0.1.0",
-                    "mypy>=1.7.0",
-                    "sphinx>=7.2.0",
-                    "sphinx-rtd-theme>=1.3.0",
-                    "pre-commit>=3.5.0",
-                    "tox>=4.11.0",
-                ],
-                directory_structure=[
-                    "src/{project_name}",
-                    "tests",
-                    "docs",
-                    "docs/source",
-                    "examples",
-                ],
-                config_files={
-                    "__init__.py": '"""Library module."""\n\n__version__ = "0.1.0"\n',
-                    "py.typed": "",  # PEP 561 marker file
-                    "tox.ini": self._get_tox_config(),
-                    "docs/conf.py": self._get_sphinx_config(),
-                },
+            "README.md": _README_TEMPLATE.substitute(
+                project_name="{project_name}", description=self.description
             ),
+            **self.config_files,
+        }
+        self.file_segments = {
+            filename: content.encode().split(b"{project_name}")
+            for filename, content in files.items()
         }
 
-    def create_project(
-        self, project_type: ProjectType, project_name: str, target_directory: str = None
-    ) -> Path:
-        """
-        Create a new project from template.
-
-        Args:
-            project_type: Type of project to create
-            project_name: Name of the project
-            target_directory: Directory to create project in (default: current)
-
-        Returns:
-            Path to the created project directory
-        """
-        template = self.templates[project_type]
-        target_dir = Path(target_directory) if target_directory else self.base_dir
-        project_path = target_dir / project_name
-
-        print(f"Creating {template.description}...")
-        print(f"Project: {project_name}")
-        print(f"Location: {project_path}")
-
-        # Create project directory
-        project_path.mkdir(parents=True, exist_ok=True)
-
-        # Create directory structure
-        self._create_directory_structure(project_path, template, project_name)
-
-        # Generate pyproject.toml
-        self._create_pyproject_toml(project_path, template, project_name)
+        digest = hashlib.blake2b(digest_size=8)
+        for directory in self.directory_structure:
+            digest.update(directory.encode() + b"\0")
+        for filename, content in files.items():
+            digest.update(filename.encode() + b"\0" + content.encode() + b"\0")
+        self.digest = digest.hexdigest()
 
-        # Create configuration files
-        self._create_config_files(project_path, template, project_name)
+    @staticmethod
+    def _format_dependencies(dependencies: List[str]) -> str:
+        """Format dependencies for pyproject.toml."""
+        return "\n".join(f'    "{dep}",' for dep in dependencies)
 
-        # Initialize UV project
-        self._initialize_uv_project(project_path)
 
-        # Create README
-        self._create_readme(project_path, template, project_name)
+# Template file contents; {project_name} is substituted by plain splitting and
+# joining, so literal braces need no escaping
 
-        print(f"✓ Project '{project_name}' created successfully!")
-        print("Next steps:")
-        print(f"  cd {project_name}")
-        print("  uv sync")
-        print(f"  uv run python -m {project_name}")
+_MICROSERVICE_MAIN: Final[str] = '''"""
+FastAPI microservice main application.
+"""
+from fastapi import FastAPI
+from {project_name}.api import health, metrics
 
-        return project_path
+app = FastAPI(
+    title="{project_name}",
+    description="A FastAPI microservice",
+    version="0.1.0"
+)
 
-    def _create_directory_structure(
-        self, project_path: Path, template: ProjectTemplate, project_name: str
-    ):
-        """Create the directory structure for the project."""
-        for directory in template.directory_structure:
-            dir_path = project_path / directory.format(project_name=project_name)
-            dir_path.mkdir(parents=True, exist_ok=True)
+# Include routers
+app.include_router(health.router, prefix="/health", tags=["health"])
+app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
-            # Create __init__.py for Python packages
-            if "src" in str(dir_path) and project_name in str(dir_path):
-                (dir_path / "__init__.py").touch()
+@app.get("/")
+async def root():
+    return {"message": "Welcome to {project_name} API"}
 
-    def _create_pyproject_toml(
-        self, project_path: Path, template: ProjectTemplate, project_name: str
-    ):
-        """Create pyproject.toml with project configuration."""
-        pyproject_content = f"""[project]
-name = "{project_name}"
-version = "0.1.0"
-description = "{template.description}"
-readme = "README.md"
-requires-python = "{template.python_version}"
-license = {{text = "MIT"}}
-authors = [
-    {{name = "Your Name", email = "your.email@example.com"}},
-]
-classifiers = [
-    "Development Status :: 3 - Alpha",
-    "Intended Audience :: Developers",
-    "License :: OSI Approved :: MIT License",
-    "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.9",
-    "Programming Language :: Python :: 3.10",
-    "Programming Language :: Python :: 3.11",
-    "Programming Language :: Python :: 3.12",
-]
-dependencies = [
-{self._format_dependencies(template.dependencies)}
-]
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
+'''
 
-[project.optional-dependencies]
-dev = [
-{self._format_dependencies(template.dev_dependencies)}
-]
+_MICROSERVICE_DOCKERFILE: Final[str] = """FROM python:3.11-slim
 
-[project.urls]
-Homepage = "https://github.com/yourusername/{project_name}"
-Repository = "https://github.com/yourusername/{project_name}.git"
-Documentation = "https://{project_name}.readthedocs.io/"
+# Install UV
+RUN pip install uv
 
-[build-system]
-requires = ["hatchling"]
-build-backend = "hatchling.build"
+WORKDIR /app
 
-[tool.hatch.build.targets.wheel]
-packages = ["src/{project_name}"]
+# Copy dependency files
+COPY pyproject.toml uv.lock ./
 
-[tool.ruff]
-line-length = 88
-target-version = "py39"
+# Install dependencies
+RUN uv sync --frozen --no-dev
 
-[tool.ruff.lint]
-select = ["E", "F", "I", "N", "W", "UP"]
-ignore = []
+# Copy application code
+COPY src/ src/
 
-[tool.mypy]
-python_version = "3.9"
-strict = true
-warn_return_any = true
-warn_unused_configs = true
+# Install the application
+RUN uv pip install -e .
 
-[tool.pytest.ini_options]
-testpaths = ["tests"]
-python_files = ["test_*.py"]
-python_classes = ["Test*"]
-python_functions = ["test_*"]
-addopts = "--cov=src/{project_name} --cov-report=term-missing --cov-report=html"
+# Expose port
+EXPOSE 8000
 
-[tool.coverage.run]
-source = ["src/{project_name}"]
+# Health check
+HEALTHCHECK --interval=30s --timeout=10s --start-period=5s --retries=3 \\
+    CMD curl -f http://localhost:8000/health || exit 1
 
-[tool.coverage.report]
-exclude_lines = [
-    "pragma: no cover",
-    "def __repr__",
-    "raise AssertionError",
-    "raise NotImplementedError",
-]
+# Run the application
+CMD ["uv", "run", "uvicorn", "{project_name}.main:app", "--host", "0.0.0.0", "--port", "8000"]
 """
 
-        (project_path / "pyproject.toml").write_text(pyproject_content)
-
-    def _format_dependencies(self, dependencies: List[str]) -> str:
-        """Format dependencies for pyproject.toml."""
-        if not dependencies:
-            return ""
-        formatted = []
-        for dep in dependencies:
-            formatted.append(f'    "{dep}",')
-        return "\n".join(formatted)
-
-    def _create_config_files(
-        self, project_path: Path, template: ProjectTemplate, project_name: str
-    ):
-        """Create additional configuration files."""
-        for filename, content in template.config_files.items():
-            file_path = project_path / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content.format(project_name=project_name))
-
-    def _initialize_uv_project(self, project_path: Path):
-        """Initialize UV project and install dependencies."""
-        try:
-            # Initialize git repository
-            subprocess.run(
-                ["git", "init"], cwd=project_path, check=True, capture_output=True
-            )
-
-            # Sync dependencies with UV
-            subprocess.run(
-                ["uv", "sync"], cwd=project_path, check=True, capture_output=True
-            )
-
-            print("✓ UV project initialized and dependencies installed")
-
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Could not initialize UV project: {e}")
-            print("You may need to run 'uv sync' manually")
-
-    def _create_readme(
-        self, project_path: Path, template: ProjectTemplate, project_name: str
-    ):
-        """Create a comprehensive README.md file."""
-        readme_content = f"""# {project_name}
-
-{template.description}
-
-## Installation
-
-```bash
-# Clone the repository
-git clone https://github.com/yourusername/{project_name}.git
-cd {project_name}
-
-# Install dependencies with UV
-uv sync
-
-# Or install in development mode
-uv pip install -e ".[dev]"
-```
-
-## Usage
-
-```python
-import {project_name}
-
-# Your usage examples here
-```
-
-## Development
-
-This project uses UV for dependency management and follows modern Python development practices.
-
-### Setup Development Environment
-
-```bash
-# Install UV if you haven't already
-curl -LsSf https://astral.sh/uv/install.sh | sh
-
-# Install all dependencies including dev dependencies
-uv sync
-
-# Install pre-commit hooks (if configured)
-uv run pre-commit install
-```
-
-### Running Tests
-
-```bash
-# Run all tests
-uv run pytest
-
-# Run tests with coverage
-uv run pytest --cov={project_name} --cov-report=html
-
-# Run specific test file
-uv run pytest tests/test_specific.py
-```
-
-### Code Quality
-
-```bash
-# Format code
-uv run black src/ tests/
-
-# Lint code
-uv run ruff check src/ tests/
-
-# Type checking
-uv run mypy src/
-```
-
-### Building and Publishing
-
-```bash
-# Build the package
-uv build
-
-# Publish to PyPI (configure authentication first)
-uv publish
-```
-
-## Project Structure
-
-```
-{project_name}/
-├── src/{project_name}/     # Main package code
-├── tests/                  # Test files
-├── docs/                   # Documentation
-├── pyproject.toml         # Project configuration
-├── README.md              # This file
-└── .gitignore            # Git ignore patterns
-```
-
-## Contributing
-
-1. Fork the repository
-2. Create a feature branch (`git checkout -b feature/amazing-feature`)
-3. Make your changes
-4. Run tests and ensure code quality
-5. Commit your changes (`git commit -m 'Add amazing feature'`)
-6. Push to the branch (`git push origin feature/amazing-feature`)
-7. Open a Pull Request
-
-## License
-
-This project is licensed under the MIT License - see the LICENSE file for details.
-"""
-
-        (project_path / "README.md").write_text(readme_content)
-
-    # Template content methods
-    def _get_microservice_main(self) -> str:
-        return '''"""
-FastAPI microservice main application.
-"""
-from fastapi import FastAPI
-from {project_name}.api import health, metrics
-
-app = FastAPI(
-    title="{project_name}",
-    description="A FastAPI microservice",
-    version="0.1.0"
-)
-
-# Include routers
-app.include_router(health.router, prefix="/health", tags=["health"])
-app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
-
-@app.get("/")
-async def root():
-    return {{"message": "Welcome to {project_name} API"}}
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''
-
-    def _get_microservice_dockerfile(self) -> str:
-        return """FROM python:3.11-slim
-
-# Install UV
-RUN pip install uv
-
-WORKDIR /app
-
-# Copy dependency files
-COPY pyproject.toml uv.lock ./
-
-# Install dependencies
-RUN uv sync --frozen --no-dev
-
-# Copy application code
-COPY src/ src/
-
-# Install the application
-RUN uv pip install -e .
-
-# Expose port
-EXPOSE 8000
-
-# Health check
-HEALTHCHECK --interval=30s --timeout=10s --start-period=5s --retries=3 \\
-    CMD curl -f http://localhost:8000/health || exit 1
-
-# Run the application
-CMD ["uv", "run", "uvicorn", "{project_name}.main:app", "--host", "0.0.0.0", "--port", "8000"]
-"""
-
-    def _get_microservice_docker_compose(self) -> str:
-        return """version: '3.8'
+_MICROSERVICE_DOCKER_COMPOSE: Final[str] = """version: '3.8'
 
 services:
   {project_name}:
@@ -566,8 +178,7 @@ services:
       start_period: 40s
 """
 
-    def _get_precommit_config(self) -> str:
-        return """repos:
+_PRECOMMIT_CONFIG: Final[str] = """repos:
   - repo: https://github.com/pre-commit/pre-commit-hooks
     rev: v4.5.0
     hooks:
@@ -594,8 +205,7 @@ services:
         additional_dependencies: [types-all]
 """
 
-    def _get_jupyter_config(self) -> str:
-        return """c = get_config()
+_JUPYTER_CONFIG: Final[str] = """c = get_config()
 
 # Notebook server configuration
 c.NotebookApp.ip = '0.0.0.0'
@@ -610,8 +220,7 @@ c.NotebookApp.nbserver_extensions = {
 }
 """
 
-    def _get_data_science_cookiecutter(self) -> str:
-        return """{
+_DATA_SCIENCE_COOKIECUTTER: Final[str] = """{
     "project_name": "Data Science Project",
     "repo_name": "data-science-project",
     "author_name": "Your Name",
@@ -621,8 +230,7 @@ c.NotebookApp.nbserver_extensions = {
 }
 """
 
-    def _get_data_science_gitignore(self) -> str:
-        return """# Data files
+_DATA_SCIENCE_GITIGNORE: Final[str] = """# Data files
 data/raw/*
 data/processed/*
 !data/raw/.gitkeep
@@ -647,8 +255,7 @@ models/*.h5
 .env
 """
 
-    def _get_cli_main(self) -> str:
-        return '''"""
+_CLI_MAIN: Final[str] = '''"""
 Command-line interface for {project_name}.
 """
 import click
@@ -672,19 +279,18 @@ if __name__ == "__main__":
     cli()
 '''
 
-    def _get_cli_config(self) -> str:
-        return '''"""
+_CLI_CONFIG: Final[str] = '''"""
 Configuration management for {project_name}.
 """
 from pathlib import Path
 from typing import Dict, Any
 import toml
 
-DEFAULT_CONFIG = {{
+DEFAULT_CONFIG = {
     "output_format": "json",
     "verbose": False,
     "cache_dir": "~/.{project_name}/cache"
-}}
+}
 
 def load_config(config_path: Path = None) -> Dict[str, Any]:
     """Load configuration from file or return defaults."""
@@ -693,8 +299,7 @@ def load_config(config_path: Path = None) -> Dict[str, Any]:
     return DEFAULT_CONFIG
 '''
 
-    def _get_tox_config(self) -> str:
-        return """[tox]
+_TOX_CONFIG: Final[str] = """[tox]
 envlist = py39,py310,py311,py312,lint,type
 
 [testenv]
@@ -716,8 +321,7 @@ deps = mypy
 commands = mypy src/
 """
 
-    def _get_sphinx_config(self) -> str:
-        return '''"""
+_SPHINX_CONFIG: Final[str] = '''"""
 Sphinx configuration file.
 """
 project = '{project_name}'
@@ -738,28 +342,692 @@ html_static_path = ['_static']
 '''
 
 
-def main():
-    """
-    Demonstration of UV project template functionality.
-    """
-    print("UV Project Template Manager Demo")
-    print("=" * 50)
+# pyproject.toml and README.md skeletons, parsed once; string.Template leaves
+# TOML's inline-table braces alone
+_PYPROJECT_TEMPLATE: Final[string.Template] = string.Template(
+    """[project]
+name = "$project_name"
+version = "0.1.0"
+description = "$description"
+readme = "README.md"
+requires-python = "$python_version"
+license = {text = "MIT"}
+authors = [
+    {name = "Your Name", email = "your.email@example.com"},
+]
+classifiers = [
+    "Development Status :: 3 - Alpha",
+    "Intended Audience :: Developers",
+    "License :: OSI Approved :: MIT License",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: 3.9",
+    "Programming Language :: Python :: 3.10",
+    "Programming Language :: Python :: 3.11",
+    "Programming Language :: Python :: 3.12",
+]
+dependencies = [
+$dependencies
+]
 
-    manager = UVProjectTemplateManager()
+[project.optional-dependencies]
+dev = [
+$dev_dependencies
+]
 
-    print("Available Project Templates:")
-    for project_type in ProjectType:
-        template = manager.templates[project_type]
-        print(f"  {project_type.value}: {template.description}")
+[project.urls]
+Homepage = "https://github.com/yourusername/$project_name"
+Repository = "https://github.com/yourusername/$project_name.git"
+Documentation = "https://$project_name.readthedocs.io/"
 
-    print("\nExample: Creating a microservice project")
-    print("Would run: manager.create_project(ProjectType.MICROSERVICE, 'my-api')")
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
 
-    print("\nExample: Creating a data science project")
-    print("Would run: manager.create_project(ProjectType.DATA_SCIENCE, 'ml-analysis')")
+[tool.hatch.build.targets.wheel]
+packages = ["src/$project_name"]
 
-    print("\nExample: Creating a CLI tool")
-    print("Would run: manager.create_project(ProjectType.CLI_TOOL, 'my-cli')")
+[tool.ruff]
+line-length = 88
+target-version = "py39"
+
+[tool.ruff.lint]
+select = ["E", "F", "I", "N", "W", "UP"]
+ignore = []
+
+[tool.mypy]
+python_version = "3.9"
+strict = true
+warn_return_any = true
+warn_unused_configs = true
+
+[tool.pytest.ini_options]
+testpaths = ["tests"]
+python_files = ["test_*.py"]
+python_classes = ["Test*"]
+python_functions = ["test_*"]
+addopts = "--cov=src/$project_name --cov-report=term-missing --cov-report=html"
+
+[tool.coverage.run]
+source = ["src/$project_name"]
+
+[tool.coverage.report]
+exclude_lines = [
+    "pragma: no cover",
+    "def __repr__",
+    "raise AssertionError",
+    "raise NotImplementedError",
+]
+"""
+)
+
+_README_TEMPLATE: Final[string.Template] = string.Template(
+    """# $project_name
+
+$description
+
+## Installation
+
+```bash
+# Clone the repository
+git clone https://github.com/yourusername/$project_name.git
+cd $project_name
+
+# Install dependencies with UV
+uv sync
+
+# Or install in development mode
+uv pip install -e ".[dev]"
+```
+
+## Usage
+
+```python
+import $project_name
+
+# Your usage examples here
+```
+
+## Development
+
+This project uses UV for dependency management and follows modern Python development practices.
+
+### Setup Development Environment
+
+```bash
+# Install UV if you haven't already
+curl -LsSf https://astral.sh/uv/install.sh | sh
+
+# Install all dependencies including dev dependencies
+uv sync
+
+# Install pre-commit hooks (if configured)
+uv run pre-commit install
+```
+
+### Running Tests
+
+```bash
+# Run all tests
+uv run pytest
+
+# Run tests with coverage
+uv run pytest --cov=$project_name --cov-report=html
+
+# Run specific test file
+uv run pytest tests/test_specific.py
+```
+
+### Code Quality
+
+```bash
+# Format code
+uv run black src/ tests/
+
+# Lint code
+uv run ruff check src/ tests/
+
+# Type checking
+uv run mypy src/
+```
+
+### Building and Publishing
+
+```bash
+# Build the package
+uv build
+
+# Publish to PyPI (configure authentication first)
+uv publish
+```
+
+## Project Structure
+
+```
+$project_name/
+├── src/$project_name/     # Main package code
+├── tests/                  # Test files
+├── docs/                   # Documentation
+├── pyproject.toml         # Project configuration
+├── README.md              # This file
+└── .gitignore            # Git ignore patterns
+```
+
+## Contributing
+
+1. Fork the repository
+2. Create a feature branch (`git checkout -b feature/amazing-feature`)
+3. Make your changes
+4. Run tests and ensure code quality
+5. Commit your changes (`git commit -m 'Add amazing feature'`)
+6. Push to the branch (`git push origin feature/amazing-feature`)
+7. Open a Pull Request
+
+## License
+
+This project is licensed under the MIT License - see the LICENSE file for details.
+"""
+)
+
+
+class UVProjectTemplateManager:
+    """
+    Advanced project template manager using UV.
+
+    Provides standardized project initialization patterns for different
+    types of Python projects with best practices and modern tooling.
+    """
+
+    def __init__(self, base_directory: str = ".", cache_dir: Optional[str] = None):
+        self.base_dir = Path(base_directory)
+        # None leaves uv on its usual cache (or the caller's UV_CACHE_DIR)
+        self.cache_dir = cache_dir
+        # (project path, marker stamp) for projects awaiting flush_syncs()
+        self._pending_syncs: List[Tuple[Path, bytes]] = []
+
+    @functools.cached_property
+    def templates(self) -> Dict[str, ProjectTemplate]:
+        """Project templates, built on first use rather than at construction."""
+        # Templates are built once per class; copy the mapping so registering
+        # a template on one manager does not leak into the others
+        return dict(self._initialize_templates())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _initialize_templates(cls) -> Dict[str, ProjectTemplate]:
+        """Initialize predefined project templates, keyed by ProjectType value."""
+        return {
+            ProjectType.MICROSERVICE.value: ProjectTemplate(
+                name="microservice",
+                description="FastAPI-based microservice with monitoring and testing",
+                dependencies=[
+                    "fastapi>=0.104.0",
+                    "uvicorn[standard]>=0.24.0",
+                    "pydantic>=2.5.0",
+                    "pydantic-settings>=2.1.0",
+                    "httpx>=0.25.0",
+                    "structlog>=23.2.0",
+                    "prometheus-client>=0.19.0",
+                ],
+                dev_dependencies=[
+                    "pytest>=7.4.0",
+                    "pytest-asyncio>=0.21.0",
+                    "pytest-cov>=4.1.0",
+                    "httpx>=0.25.0",
+                    "ruff>=0.1.0",
+                    "mypy>=1.7.0",
+                    "pre-commit>=3.5.0",
+                ],
+                directory_structure=[
+                    "src/{project_name}",
+                    "src/{project_name}/api",
+                    "src/{project_name}/core",
+                    "src/{project_name}/models",
+                    "tests",
+                    "tests/unit",
+                    "tests/integration",
+                    "docker",
+                    "docs",
+                    "scripts",
+                ],
+                config_files={
+                    "main.py": _MICROSERVICE_MAIN,
+                    "Dockerfile": _MICROSERVICE_DOCKERFILE,
+                    "docker-compose.yml": _MICROSERVICE_DOCKER_COMPOSE,
+                    ".pre-commit-config.yaml": _PRECOMMIT_CONFIG,
+                },
+            ),
+            ProjectType.DATA_SCIENCE.value: ProjectTemplate(
+                name="data_science",
+                description="Data science project with Jupyter, pandas, and MLOps tools",
+                dependencies=[
+                    "pandas>=2.1.0",
+                    "numpy>=1.25.0",
+                    "matplotlib>=3.8.0",
+                    "seaborn>=0.13.0",
+                    "scikit-learn>=1.3.0",
+                    "jupyter>=1.0.0",
+                    "plotly>=5.17.0",
+                    "mlflow>=2.8.0",
+                ],
+                dev_dependencies=[
+                    "pytest>=7.4.0",
+                    "black>=23.0.0",
+                    "isort>=5.12.0",
+                    "flake8>=6.1.0",
+                    "mypy>=1.7.0",
+                    "nbqa>=1.7.0",
+                ],
+                directory_structure=[
+                    "data/raw",
+                    "data/processed",
+                    "data/external",
+                    "notebooks",
+                    "src/{project_name}",
+                    "src/{project_name}/data",
+                    "src/{project_name}/features",
+                    "src/{project_name}/models",
+                    "src/{project_name}/visualization",
+                    "tests",
+                    "reports/figures",
+                    "models",
+                ],
+                config_files={
+                    "jupyter_config.py": _JUPYTER_CONFIG,
+                    "cookiecutter.json": _DATA_SCIENCE_COOKIECUTTER,
+                    ".gitignore": _DATA_SCIENCE_GITIGNORE,
+                },
+            ),
+            ProjectType.CLI_TOOL.value: ProjectTemplate(
+                name="cli_tool",
+                description="Command-line interface tool with Click and rich output",
+                dependencies=[
+                    "click>=8.1.0",
+                    "rich>=13.7.0",
+                    "typer>=0.9.0",
+                    "pydantic>=2.5.0",
+                    "toml>=0.10.0",
+                ],
+                dev_dependencies=[
+                    "pytest>=7.4.0",
+                    "pytest-click>=1.1.0",
+                    "black>=23.0.0",
+                    "ruff>=0.1.0",
+                    "mypy>=1.7.0",
+                ],
+                directory_structure=[
+                    "src/{project_name}",
+                    "src/{project_name}/commands",
+                    "src/{project_name}/config",
+                    "src/{project_name}/utils",
+                    "tests",
+                    "docs",
+                ],
+                config_files={
+                    "cli.py": _CLI_MAIN,
+                    "config.py": _CLI_CONFIG,
+                },
+            ),
+            ProjectType.LIBRARY.value: ProjectTemplate(
+                name="library",
+                description="Python library with comprehensive testing and documentation",
+                dependencies=[],  # Minimal dependencies for libraries
+                dev_dependencies=[
+                    "pytest>=7.4.0",
+                    "pytest-cov>=4.1.0",
+                    "black>=23.0.0",
+                    "ruff>=0.1.0",
+                    "mypy>=1.7.0",
+                    "sphinx>=7.2.0",
+                    "sphinx-rtd-theme>=1.3.0",
+                    "pre-commit>=3.5.0",
+                    "tox>=4.11.0",
+                ],
+                directory_structure=[
+                    "src/{project_name}",
+                    "tests",
+                    "docs",
+                    "docs/source",
+                    "examples",
+                ],
+                config_files={
+                    "__init__.py": '"""Library module."""\n\n__version__ = "0.1.0"\n',
+                    "py.typed": "",  # PEP 561 marker file
+                    "tox.ini": _TOX_CONFIG,
+                    "docs/conf.py": _SPHINX_CONFIG,
+                },
+            ),
+        }
+
+    @staticmethod
+    def _uv_env(cache_dir: Optional[str]) -> Optional[Dict[str, str]]:
+        """Environment for uv; None inherits ours, so uv picks its own cache."""
+        if cache_dir is None:
+            return None
+        return {**os.environ, "UV_CACHE_DIR": str(cache_dir)}
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def prewarm_cache(cls, project_type: ProjectType, cache_dir: Optional[str] = None):
+        """
+        Download a template's dependencies into the UV cache once.
+
+        Later uv sync runs for projects of this type then link wheels from
+        the local cache instead of fetching them again. Pass the manager's
+        cache_dir when it uses a dedicated cache; by default uv's usual
+        cache is warmed.
+        """
+        template = cls._initialize_templates()[project_type.value]
+        requirements = "\n".join(template.dependencies + template.dev_dependencies)
+        # uv has no "pip download"; installing into a throwaway target fills
+        # the cache the same way
+        with tempfile.TemporaryDirectory() as target:
+            subprocess.run(
+                ["uv", "pip", "install", "--target", target, "-r", "-"],
+                input=requirements,
+                text=True,
+                env=cls._uv_env(cache_dir),
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+
+    def create_project(
+        self,
+        project_type: ProjectType,
+        project_name: str,
+        target_directory: str = None,
+        defer_sync: bool = False,
+    ) -> Path:
+        """
+        Create a new project from template.
+
+        Args:
+            project_type: Type of project to create
+            project_name: Name of the project
+            target_directory: Directory to create project in (default: current)
+            defer_sync: Queue uv sync for flush_syncs() instead of running it now
+
+        Returns:
+            Path to the created project directory
+        """
+        template = self.templates[project_type.value]
+        target_dir = Path(target_directory) if target_directory else self.base_dir
+        project_path = target_dir / project_name
+
+        # A marker from an identical earlier run means there is nothing to do
+        marker = project_path / TEMPLATE_MARKER
+        stamp = f"{template.digest} {project_name}\n".encode()
+        try:
+            if marker.read_bytes() == stamp:
+                sys.stdout.write(f"✓ Project '{project_name}' is already up to date\n")
+                return project_path
+        except OSError:
+            pass
+
+        sys.stdout.write(
+            f"Creating {template.description}...\n"
+            f"Project: {project_name}\n"
+            f"Location: {project_path}\n"
+        )
+
+        # Create project directory
+        project_path.mkdir(parents=True, exist_ok=True)
+
+        # Create directory structure
+        created_dirs = self._create_directory_structure(
+            project_path, template, project_name
+        )
+
+        # Generate pyproject.toml, README and configuration files. README.md
+        # must exist before uv sync, since pyproject.toml declares it
+        self._write_files(
+            project_path, self._render_files(template, project_name), created_dirs
+        )
+
+        # Initialize UV project; only a fully set-up project gets the marker,
+        # so a failed sync is retried on the next call
+        if defer_sync:
+            if self._init_git(project_path):
+                self._pending_syncs.append((project_path, stamp))
+        elif self._initialize_uv_project(project_path):
+            marker.write_bytes(stamp)
+
+        # One write per report rather than a print per line
+        sys.stdout.write(
+            f"✓ Project '{project_name}' created successfully!\n"
+            "Next steps:\n"
+            f"  cd {project_name}\n"
+            "  uv sync\n"
+            f"  uv run python -m {project_name}\n"
+        )
+
+        return project_path
+
+    def flush_syncs(self):
+        """Run the uv sync calls deferred by create_project in parallel."""
+        pending, self._pending_syncs = self._pending_syncs, []
+        if not pending:
+            return
+
+        # Each sync is mostly network and cache I/O, so they overlap well
+        workers = min(MAX_SYNC_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(self._sync_project, [path for path, _ in pending])
+            )
+        for (project_path, stamp), synced in zip(pending, results):
+            if synced:
+                (project_path / TEMPLATE_MARKER).write_bytes(stamp)
+
+    def _create_directory_structure(
+        self, project_path: Path, template: ProjectTemplate, project_name: str
+    ) -> Set[str]:
+        """
+        Create the directory structure for the project.
+
+        Returns the created directories relative to the project root, with
+        "" standing for the root itself.
+        """
+        # Plain strings relative to the project root; the entries are fixed
+        # "/"-separated names, so pathlib objects would add nothing
+        base = os.fspath(project_path)
+        relative_dirs = sorted(
+            {
+                directory.replace("{project_name}", project_name)
+                for directory in template.directory_structure
+            },
+            key=lambda relative: relative.count("/"),
+        )
+        # Shallowest first, so a known parent lets mkdir skip the ancestor walk
+        created = {""}
+        for relative in relative_dirs:
+            full = os.path.join(base, relative)
+            if relative.rpartition("/")[0] in created:
+                try:
+                    os.mkdir(full)
+                except FileExistsError:
+                    pass
+            else:
+                os.makedirs(full, exist_ok=True)
+            created.add(relative)
+
+            # Create __init__.py for Python packages; only components below
+            # the project root count, so an enclosing .../src/... does not match
+            parts = relative.split("/")
+            if "src" in parts and project_name in parts:
+                self._create_empty_file(os.path.join(full, "__init__.py"))
+
+        return created
+
+    def _render_files(
+        self, template: ProjectTemplate, project_name: str
+    ) -> Dict[str, bytes]:
+        """Render every generated file of a template as UTF-8 bytes."""
+        name = project_name.encode()
+        return {
+            filename: name.join(segments)
+            for filename, segments in template.file_segments.items()
+        }
+
+    def _write_files(
+        self,
+        project_path: Path,
+        files: Dict[str, bytes],
+        created_dirs: AbstractSet[str] = frozenset(),
+    ):
+        """Write generated files concurrently to overlap per-file I/O waits."""
+        # Only parents missing from created_dirs need a mkdir
+        parents = {filename.rpartition("/")[0] for filename in files} - created_dirs
+        for parent in parents:
+            (project_path / parent).mkdir(parents=True, exist_ok=True)
+
+        contents = {project_path / filename: data for filename, data in files.items()}
+
+        with ThreadPoolExecutor(max_workers=FILE_WRITE_WORKERS) as executor:
+            # Consuming the results re-raises the first write error, if any
+            list(executor.map(self._write_file, contents, contents.values()))
+
+    @classmethod
+    def _write_file(cls, file_path: Path, data: bytes):
+        """Write one generated file; empty marker files are only created."""
+        if data:
+            file_path.write_bytes(data)
+        else:
+            cls._create_empty_file(file_path)
+
+    @staticmethod
+    def _create_empty_file(file_path: Union[str, Path]):
+        """Create an empty file if missing, without the utime call of touch()."""
+        if not os.path.lexists(file_path):
+            os.close(os.open(file_path, os.O_WRONLY | os.O_CREAT, 0o644))
+
+    def _initialize_uv_project(self, project_path: Path) -> bool:
+        """Initialize UV project and install dependencies; True on success."""
+        return self._init_git(project_path) and self._sync_project(project_path)
+
+    def _init_git(self, project_path: Path) -> bool:
+        """Initialize the git repository; True on success."""
+        try:
+            # The empty layout is fixed, so it is written directly instead
+            # of spawning git init where possible
+            self._bootstrap_git(project_path)
+            return True
+
+        except (subprocess.CalledProcessError, OSError) as e:
+            self._warn_init_failure(e)
+            return False
+
+    @staticmethod
+    def _warn_init_failure(error: Exception):
+        """Report a failed project initialization step."""
+        print(f"Warning: Could not initialize UV project: {error}")
+        stderr = getattr(error, "stderr", None)
+        if stderr:
+            print(stderr.decode(errors="replace").rstrip())
+        print("You may need to run 'uv sync' manually")
+
+    def _sync_project(self, project_path: Path) -> bool:
+        """Sync dependencies with UV; True on success."""
+        try:
+            # Only stderr is kept, for the error report
+            subprocess.run(
+                ["uv", "sync"],
+                cwd=project_path,
+                env=self._uv_env(self.cache_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+
+            print("✓ UV project initialized and dependencies installed")
+            return True
+
+        except subprocess.CalledProcessError as e:
+            self._warn_init_failure(e)
+            return False
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _git_init_settings() -> Dict[str, str]:
+        """The user's init.* git settings (lower-cased keys), read once."""
+        try:
+            result = subprocess.run(
+                ["git", "config", "--get-regexp", r"^init\."],
+                capture_output=True,
+                text=True,
+            )
+        except OSError:
+            return {}
+
+        settings = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(" ")
+            settings[key] = value
+        return settings
+
+    @classmethod
+    def _bootstrap_git(cls, project_path: Path):
+        """
+        Create an empty git repository, writing the .git layout directly on Linux.
+
+        The direct layout is not equivalent to git init: it installs no hooks
+        or template files and skips git's filesystem probes, assuming the
+        filemode, case-sensitivity and symlink behaviour of a typical Linux
+        filesystem. Other platforms, and users with init.templateDir set, get
+        a real git init. The initial branch follows init.defaultBranch.
+        """
+        git_dir = project_path / ".git"
+        if git_dir.exists():
+            return
+
+        settings = cls._git_init_settings()
+        if not sys.platform.startswith("linux") or "init.templatedir" in settings:
+            subprocess.run(
+                ["git", "init"],
+                cwd=project_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+            return
+
+        branch = settings.get("init.defaultbranch", "main")
+        for subdir in ("refs/heads", "refs/tags", "objects/info", "objects/pack"):
+            (git_dir / subdir).mkdir(parents=True)
+        (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n")
+        (git_dir / "config").write_text(
+            "[core]\n"
+            "\trepositoryformatversion = 0\n"
+            "\tfilemode = true\n"
+            "\tbare = false\n"
+            "\tlogallrefupdates = true\n"
+        )
+
+
+def main():
+    """
+    Demonstration of UV project template functionality.
+    """
+    print("UV Project Template Manager Demo")
+    print("=" * 50)
+
+    manager = UVProjectTemplateManager()
+
+    print("Available Project Templates:")
+    for type_name, template in manager.templates.items():
+        print(f"  {type_name}: {template.description}")
+
+    print("\nExample: Creating a microservice project")
+    print("Would run: manager.create_project(ProjectType.MICROSERVICE, 'my-api')")
+
+    print("\nExample: Creating a data science project")
+    print("Would run: manager.create_project(ProjectType.DATA_SCIENCE, 'ml-analysis')")
+
+    print("\nExample: Creating a CLI tool")
+    print("Would run: manager.create_project(ProjectType.CLI_TOOL, 'my-cli')")
+
+    print("\nExample: Creating several projects and syncing them together")
+    print("Would run: manager.create_project(..., defer_sync=True) for each project")
+    print("           manager.flush_syncs()")
 
     print("\nFeatures demonstrated:")
     print("• Template-based project generation")
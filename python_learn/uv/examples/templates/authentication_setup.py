@@ -0,0 +1,48 @@
+import os
+import keyring
+from getpass import getpass
+
+def setup_private_repo_auth():
+    '''Setup authentication for private repositories'''
+    
+    # Option 1: Environment variables (recommended for CI/CD)
+    repos = {
+        "PRIVATE_COMPANY": "https://pypi.private-company.com/simple/",
+        "ARTIFACTS": "https://artifacts.company.com/pypi/simple/"
+    }
+    
+    env = os.environ
+    for repo_name, repo_url in repos.items():
+        username_key = f"UV_INDEX_{repo_name}_USERNAME"
+        password_key = f"UV_INDEX_{repo_name}_PASSWORD"
+        
+        if username_key in env and password_key in env:
+            continue
+        
+        username = input(f"Username for {repo_url}: ")
+        password = getpass(f"Password for {repo_url}: ")
+        
+        # Store in system keyring
+        service = f"uv_{repo_name.lower()}"
+        keyring.set_password(service, "username", username)
+        keyring.set_password(service, "password", password)
+        
+        print(f"Set environment variables:")
+        print(f"export {username_key}={username}")
+        print(f"export {password_key}='<password>'")
+
+def test_private_repo_access():
+    '''Test access to configured private repositories'''
+    import subprocess
+    
+    try:
+        # Test installation from private repo
+        result = subprocess.run([
+            "uv", "pip", "install", "--dry-run", "private-package-name"
+        ], capture_output=True, text=True, check=True)
+        
+        print("✓ Private repository access configured correctly")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Private repository access failed: {e.stderr}")
+        return False
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from blake3 import blake3 as hasher
+except ImportError:
+    from hashlib import blake2b as hasher
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+MEMBER_DIRS = ("packages", "services")
+TEST_CACHE = Path(".uv-cache") / "workspace-tests.json"
+MAX_TEST_WORKERS = 4
+
+def _normalize(name):
+    '''PEP 503 normalized project name, as uv compares them'''
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def _run_member_tests(job):
+    '''Run one member's tests; module-level so the process pool can pickle it'''
+    root, key, package = job
+    return subprocess.run([
+        "uv", "run", "--package", package,
+        "pytest", f"{key}/tests/"
+    ], cwd=root).returncode
+
+class WorkspaceManager:
+    def __init__(self, workspace_root: str = "."):
+        self.root = Path(workspace_root)
+        self.cache_path = self.root / TEST_CACHE
+
+    def sync_all_projects(self):
+        '''Sync dependencies for all workspace members'''
+        subprocess.run(["uv", "sync", "--all-packages"], check=True)
+
+    def members(self):
+        '''List workspace member directories'''
+        return sorted(
+            member
+            for member_dir in MEMBER_DIRS
+            if (self.root / member_dir).exists()
+            for member in (self.root / member_dir).iterdir()
+            if member.is_dir()
+        )
+
+    def _read_project(self, member):
+        '''Project name and workspace dependencies from a member's pyproject.toml'''
+        with open(member / "pyproject.toml", "rb") as f:
+            data = tomllib.load(f)
+        name = data.get("project", {}).get("name", member.name)
+        sources = data.get("tool", {}).get("uv", {}).get("sources", {})
+        workspace_deps = sorted(
+            _normalize(dep)
+            for dep, source in sources.items()
+            if isinstance(source, dict) and source.get("workspace")
+        )
+        return name, workspace_deps
+
+    def _input_files(self, member):
+        '''Files whose changes invalidate a member's cached test pass'''
+        files = sorted(member.rglob("*.py"))
+        files += [
+            path
+            for path in (member / "pyproject.toml", self.root / "uv.lock")
+            if path.exists()
+        ]
+        return files
+
+    def _fingerprint(self, member):
+        '''Cheap digest of (path, mtime, size) for a member's input files'''
+        digest = hasher()
+        for path in self._input_files(member):
+            stat = path.stat()
+            relative = os.path.relpath(path, member)
+            digest.update(f"{relative}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        return digest.hexdigest()
+
+    def _content_hash(self, member):
+        '''Digest of the input files, checked only when the stats differ'''
+        digest = hasher()
+        for path in self._input_files(member):
+            digest.update(os.path.relpath(path, member).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _combined_keys(self, projects, own_key):
+        '''
+        Fold each member's workspace dependencies into its key, so a change
+        to packages/core also invalidates the members that depend on it
+        '''
+        by_name = {_normalize(name): member for member, (name, _) in projects.items()}
+        keys = {}
+
+        def key_for(member):
+            if member not in keys:
+                keys[member] = ""  # guards against dependency cycles
+                digest = hasher()
+                digest.update(own_key(member).encode())
+                for dep in projects[member][1]:
+                    if dep in by_name:
+                        digest.update(key_for(by_name[dep]).encode())
+                keys[member] = digest.hexdigest()
+            return keys[member]
+
+        return key_for
+
+    def _load_test_cache(self):
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_test_cache(self, cache):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+    def changed_members(self, cache):
+        '''
+        Members whose inputs changed since their tests last passed: their
+        Python sources, their pyproject.toml, the root uv.lock, or any
+        workspace member they depend on
+        '''
+        projects = {member: self._read_project(member) for member in self.members()}
+        fingerprint_of = self._combined_keys(projects, self._fingerprint)
+        content_of = self._combined_keys(projects, self._content_hash)
+
+        changed = []
+        for member, (package, _) in projects.items():
+            key = str(member.relative_to(self.root))
+            entry = cache.get(key, {})
+            fingerprint = fingerprint_of(member)
+            if entry.get("stat") == fingerprint:
+                continue
+
+            content = content_of(member)
+            if entry.get("content") == content:
+                # Touched but not modified: refresh the fast-path key only
+                cache[key] = {"stat": fingerprint, "content": content}
+                continue
+
+            changed.append((key, package, fingerprint, content))
+        return changed
+
+    def run_tests_all(self):
+        '''Run tests in parallel for workspace members whose inputs changed'''
+        cache = self._load_test_cache()
+        changed = self.changed_members(cache)
+        returncodes = []
+        if changed:
+            # Members are independent processes; cap at 4 workers since
+            # wider fan-out tends to regress on shared CI runners
+            workers = min(MAX_TEST_WORKERS, os.cpu_count() or 1, len(changed))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                returncodes = list(executor.map(
+                    _run_member_tests,
+                    [(self.root, key, package) for key, package, _, _ in changed],
+                ))
+
+        failed = []
+        for (key, _, fingerprint, content), returncode in zip(changed, returncodes):
+            if returncode == 0:
+                cache[key] = {"stat": fingerprint, "content": content}
+            else:
+                failed.append(key)
+
+        # Record passing members even when others fail
+        self._save_test_cache(cache)
+        if failed:
+            raise RuntimeError(f"Tests failed for: {', '.join(failed)}")
+
+    def build_all_packages(self):
+        '''Build all distributable packages'''
+        subprocess.run(["uv", "build", "--all"], check=True)